@@ -0,0 +1,258 @@
+"""
+Async Telegram Alerting - התראות מקבילות
+=========================================
+
+גרסת asyncio של TelegramAlerter - אופציונלית, main.py לא משתמש בה.
+
+דורש aiohttp (לא חלק מה-dependencies הרגילים):
+    pip install aiohttp
+
+שימו לב: אין כאן dedup ואין journal (alerts.jsonl) כמו ב-TelegramAlerter -
+התראה שנכשלה לא נשלחת שוב. למעקב רציף משתמשים ב-TelegramAlerter.
+
+מתי להשתמש:
+- כשצריך לשלוח כמה התראות בבת אחת (למשל 10 מכשירים חדשים בסריקה)
+- כל ההתראות יוצאות במקביל על אותו connection pool
+
+הטקסט של ההודעות זהה לגמרי ל-TelegramAlerter (אותן פונקציות format).
+
+שימוש:
+    async with AsyncTelegramAlerter(bot_token, chat_id) as alerter:
+        await asyncio.gather(*(alerter.send_new_device_alert(d) for d in devices))
+"""
+
+import asyncio
+from typing import Optional, List, Tuple, Union
+import logging
+
+from alerting.telegram_bot import TelegramAlerter, Severity, _is_silent
+from alerting.rate_limiter import (
+    TelegramRateLimiter,
+    DEFAULT_RATE_PER_SECOND,
+    DEFAULT_RATE_PER_MINUTE_PER_CHAT
+)
+
+try:
+    import aiohttp
+except ImportError as e:
+    raise ImportError("AsyncTelegramAlerter requires aiohttp: pip install aiohttp") from e
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTelegramAlerter:
+    """
+    מערכת התראות Telegram - גרסת asyncio
+    """
+    
+    # כמה בקשות פתוחות במקביל ב-broadcast
+    BROADCAST_CONCURRENCY = 25
+    
+    def __init__(self, bot_token: str, chat_id: str, rate_limit: Optional[dict] = None):
+        """
+        אתחול Async Telegram Bot
+        
+        ה-ClientSession נוצר רק בשליחה הראשונה, כי הוא חייב להיווצר
+        בתוך event loop רץ.
+        
+        Args:
+            bot_token: Token של הבוט מ-@BotFather
+            chat_id: Chat ID שלך
+            rate_limit: הגדרות rate limit (כמו ב-TelegramAlerter)
+        """
+        self.bot_token = bot_token
+        self.chat_id = chat_id
+        self.base_url = f"https://api.telegram.org/bot{bot_token}"
+        self._url_send = f"{self.base_url}/sendMessage"
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        rate_limit = rate_limit or {}
+        self._limiter = TelegramRateLimiter(
+            rate_per_second=rate_limit.get('rate_per_second', DEFAULT_RATE_PER_SECOND),
+            rate_per_minute_per_chat=rate_limit.get('rate_per_minute_per_chat', DEFAULT_RATE_PER_MINUTE_PER_CHAT)
+        )
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        מחזיר את ה-ClientSession (יוצר אותו בפעם הראשונה)
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=64, keepalive_timeout=75)
+            )
+        return self._session
+    
+    async def close(self):
+        """
+        סוגר את ה-ClientSession וכל החיבורים הפתוחים
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def _post(
+        self,
+        message: str,
+        parse_mode: str = "Markdown",
+        disable_notification: bool = False
+    ) -> Tuple[bool, float]:
+        """
+        בקשת sendMessage אחת (אחרי שה-rate limiter אישר)
+        
+        Returns:
+            (האם נשלח, retry_after בשניות אם קיבלנו 429 - אחרת 0)
+        """
+        data = {
+            "chat_id": self.chat_id,
+            "text": message,
+            "parse_mode": parse_mode,
+            "disable_notification": disable_notification
+        }
+        
+        async with self._get_session().post(
+            self._url_send, json=data, timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            if response.status == 200:
+                logger.debug("Message sent successfully")
+                return True, 0
+            
+            if response.status == 429:
+                body = await response.json(content_type=None)
+                return False, body.get('parameters', {}).get('retry_after', 1)
+            
+            logger.error(f"Failed to send message: {await response.text()}")
+            return False, 0
+    
+    async def send_message(
+        self,
+        message: str,
+        parse_mode: str = "Markdown",
+        disable_notification: bool = False
+    ) -> bool:
+        """
+        שליחת הודעה רגילה
+        
+        Args:
+            message: תוכן ההודעה
+            parse_mode: "Markdown" או "HTML"
+            disable_notification: True = silent notification
+        
+        Returns:
+            True אם נשלח בהצלחה
+        """
+        try:
+            await self._limiter.acquire_async(self.chat_id)
+            sent, _ = await self._post(message, parse_mode, disable_notification)
+            return sent
+        
+        except Exception as e:
+            logger.error(f"Error sending message: {e}")
+            return False
+    
+    async def broadcast(
+        self,
+        messages: List[str],
+        disable_notification: bool = True,
+        max_retry_after: float = 30
+    ) -> bool:
+        """
+        שליחת הרבה הודעות במקביל - בלי לחרוג מהמגבלות של טלגרם
+        
+        עד BROADCAST_CONCURRENCY בקשות פתוחות בו-זמנית, וכל בקשה
+        עוברת דרך ה-rate limiter. על 429 עם retry_after קצר - מחכים
+        ומנסים שוב פעם אחת. אם טלגרם מבקש לחכות יותר מ-max_retry_after,
+        מפסיקים את כל ה-broadcast.
+        
+        Args:
+            messages: ההודעות לשליחה
+            disable_notification: True = silent notification
+            max_retry_after: מקסימום שניות המתנה לפני שמוותרים
+        
+        Returns:
+            True אם כל ההודעות נשלחו
+        """
+        semaphore = asyncio.Semaphore(self.BROADCAST_CONCURRENCY)
+        
+        async def send_one(message: str) -> Tuple[bool, float]:
+            async with semaphore:
+                await self._limiter.acquire_async(self.chat_id)
+                sent, retry_after = await self._post(message, disable_notification=disable_notification)
+                
+                if not sent and 0 < retry_after <= max_retry_after:
+                    await asyncio.sleep(retry_after)
+                    await self._limiter.acquire_async(self.chat_id)
+                    sent, retry_after = await self._post(message, disable_notification=disable_notification)
+                
+                return sent, retry_after
+        
+        tasks = [asyncio.ensure_future(send_one(message)) for message in messages]
+        sent_count = 0
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    sent, retry_after = await next_done
+                except Exception as e:
+                    logger.error(f"Error sending message: {e}")
+                    continue
+                
+                if sent:
+                    sent_count += 1
+                elif retry_after > max_retry_after:
+                    logger.error(f"Telegram asked to wait {retry_after}s - aborting broadcast")
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        logger.info(f"Broadcast complete: {sent_count}/{len(messages)} messages sent")
+        return sent_count == len(messages)
+    
+    async def send_alert(
+        self,
+        severity: Union[str, Severity],
+        title: str,
+        description: str,
+        details: Optional[dict] = None,
+        ts: Optional[float] = None
+    ) -> bool:
+        """
+        שליחת התראת אבטחה מעוצבת
+        
+        Args:
+            severity: Severity או CRITICAL/HIGH/MEDIUM/LOW/INFO
+            title: כותרת ההתראה
+            description: תיאור
+            details: מידע נוסף (dictionary)
+            ts: זמן האירוע (time.time()) - ברירת מחדל: עכשיו
+        
+        Returns:
+            True אם נשלח
+        """
+        message = TelegramAlerter.format_alert(severity, title, description, details, ts)
+        
+        # שלח (בלי silent notification ל-HIGH ו-CRITICAL)
+        silent = _is_silent(severity)
+        
+        return await self.send_message(message, disable_notification=silent)
+    
+    async def send_new_device_alert(self, device: dict, ts: Optional[float] = None) -> bool:
+        """
+        התראה על מכשיר חדש ברשת
+        
+        Args:
+            device: מידע על המכשיר
+            ts: זמן הסריקה (time.time()) - ברירת מחדל: עכשיו
+        
+        Returns:
+            True אם נשלח
+        """
+        message = TelegramAlerter.format_new_device_alert(device, ts)
+        
+        return await self.send_message(message, disable_notification=False)
@@ -0,0 +1,139 @@
+"""
+Rate Limiter - הגבלת קצב שליחה לטלגרם
+=======================================
+
+טלגרם חוסם בוטים ששולחים יותר מדי הודעות:
+- 30 הודעות לשנייה (גלובלי)
+- 20 הודעות לדקה לאותו צ'אט
+
+חריגה מחזירה HTTP 429 עם retry_after - לפעמים של 30+ שניות.
+כאן יש שני token buckets (גלובלי + לכל צ'אט) שמונעים מאיתנו להגיע לשם.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict
+
+# ברירות מחדל - קצת מתחת לגבולות של טלגרם
+DEFAULT_RATE_PER_SECOND = 25
+DEFAULT_GLOBAL_CAPACITY = 30
+DEFAULT_RATE_PER_MINUTE_PER_CHAT = 20
+
+
+class TokenBucket:
+    """
+    Token bucket קלאסי
+    
+    מתמלא ב-rate טוקנים לשנייה, עד capacity.
+    כל הודעה צורכת טוקן אחד.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: כמה טוקנים מתווספים בשנייה
+            capacity: מקסימום טוקנים (גודל ה-burst)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+    
+    def refill(self, now: float):
+        """
+        ממלא טוקנים לפי הזמן שעבר מאז העדכון האחרון
+        """
+        elapsed = now - self.updated
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+    
+    def wait_time(self) -> float:
+        """
+        Returns:
+            כמה שניות צריך לחכות עד שיהיה טוקן (0 אם יש כבר)
+        """
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class TelegramRateLimiter:
+    """
+    Rate limiter כפול: bucket גלובלי + bucket לכל chat_id
+    
+    Thread-safe - אפשר לקרוא ל-acquire מכמה threads.
+    """
+    
+    def __init__(
+        self,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        rate_per_minute_per_chat: float = DEFAULT_RATE_PER_MINUTE_PER_CHAT
+    ):
+        """
+        Args:
+            rate_per_second: קצב גלובלי (הודעות לשנייה)
+            rate_per_minute_per_chat: קצב לכל צ'אט (הודעות לדקה)
+        """
+        self.global_bucket = TokenBucket(
+            rate=rate_per_second,
+            capacity=max(rate_per_second, DEFAULT_GLOBAL_CAPACITY)
+        )
+        self.rate_per_minute_per_chat = rate_per_minute_per_chat
+        self.chat_buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+    
+    def _chat_bucket(self, chat_id: str) -> TokenBucket:
+        bucket = self.chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = TokenBucket(
+                rate=self.rate_per_minute_per_chat / 60,
+                capacity=self.rate_per_minute_per_chat
+            )
+            self.chat_buckets[chat_id] = bucket
+        return bucket
+    
+    def _try_take(self, chat_id: str) -> float:
+        """
+        מנסה לקחת טוקן משני ה-buckets
+        
+        Returns:
+            0 אם נלקח טוקן, אחרת כמה שניות לחכות לפני ניסיון נוסף
+        """
+        with self._lock:
+            now = time.monotonic()
+            chat_bucket = self._chat_bucket(str(chat_id))
+            self.global_bucket.refill(now)
+            chat_bucket.refill(now)
+            
+            wait = max(self.global_bucket.wait_time(), chat_bucket.wait_time())
+            if wait == 0:
+                self.global_bucket.tokens -= 1
+                chat_bucket.tokens -= 1
+            return wait
+    
+    def acquire(self, chat_id: str):
+        """
+        חוסם עד שמותר לשלוח הודעה נוספת ל-chat_id
+        
+        Args:
+            chat_id: הצ'אט שאליו שולחים
+        """
+        while True:
+            wait = self._try_take(chat_id)
+            if wait == 0:
+                return
+            time.sleep(wait)
+    
+    async def acquire_async(self, chat_id: str):
+        """
+        כמו acquire, אבל ממתין עם asyncio.sleep - לא חוסם את ה-event loop
+        
+        Args:
+            chat_id: הצ'אט שאליו שולחים
+        """
+        while True:
+            wait = self._try_take(chat_id)
+            if wait == 0:
+                return
+            await asyncio.sleep(wait)
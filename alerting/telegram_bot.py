@@ -19,31 +19,277 @@ Setup:
 6. הרץ את get_chat_id() לקבל CHAT_ID
 """
 
+import atexit
+import hashlib
+import os
+import threading
+import sys
+import time
+from enum import IntEnum
+from pathlib import Path
 import requests
-import json
-from datetime import datetime
-from typing import Optional, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, List, Dict, Tuple, Union
 import logging
 
+# הרצה ישירה (python3 alerting/telegram_bot.py) - שורש הפרויקט ל-sys.path, כמו ב-main.py
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.json_utils import json_dumps as _json_dumps, json_loads as _json_loads
+from alerting.rate_limiter import (
+    TelegramRateLimiter,
+    DEFAULT_RATE_PER_SECOND,
+    DEFAULT_RATE_PER_MINUTE_PER_CHAT
+)
+
 logger = logging.getLogger(__name__)
 
+# שולחים bytes מוכנים ב-data=, אז ה-Content-Type ידני
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# פורמט זמן אחיד לכל ההודעות
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class Severity(IntEnum):
+    """
+    רמות חומרה - מסודרות מהנמוכה לגבוהה (אפשר להשוות ולמיין)
+    """
+    INFO = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+    
+    @classmethod
+    def parse(cls, value: Union[str, 'Severity']) -> Optional['Severity']:
+        """
+        ממיר 'HIGH' / Severity.HIGH ל-Severity (None אם לא מוכר)
+        """
+        if isinstance(value, cls):
+            return value
+        return cls.__members__.get(str(value).upper())
+
+
+# לפי אינדקס Severity: INFO, LOW, MEDIUM, HIGH, CRITICAL
+_EMOJIS = ('ℹ️', '🔵', '🟡', '🟠', '🔴')
+_IS_SILENT = (True, True, False, False, False)  # silent notification
+
+
+def _is_silent(severity: Union[str, Severity]) -> bool:
+    """
+    האם לשלוח בלי צליל (LOW / INFO)
+    """
+    level = Severity.parse(severity)
+    return _IS_SILENT[level] if level is not None else False
+
+
+def _fmt_ts(ts: Optional[float] = None, fmt: str = TIMESTAMP_FORMAT) -> str:
+    """
+    מפרמט timestamp (time.time()) - או את הזמן הנוכחי אם לא הועבר
+    """
+    return time.strftime(fmt, time.localtime(ts if ts is not None else time.time()))
+
+
+def _code(value) -> str:
+    """
+    עוטף ערך ב-code span של Markdown - כך ש-_ / * / [ בשם מכשיר או יצרן
+    לא שוברים את ה-parse של טלגרם (backtick בתוך הערך לא יכול להופיע ב-span)
+    """
+    text = str(value).replace('`', "'")
+    return f"`{text}`"
+
+
+def _split_markdown(body: str, limit: int = 4000) -> List[str]:
+    """
+    מפצל הודעה ארוכה לכמה הודעות (טלגרם מגביל ל-4096 תווים)
+    
+    מפצל רק בגבולות שורה, כך שאף שורת Markdown לא נחתכת באמצע.
+    
+    Args:
+        body: ההודעה המלאה
+        limit: גודל מקסימלי לכל חלק (בבתים, UTF-8)
+        
+    Returns:
+        רשימת חלקים, כל אחד עד limit בתים
+    """
+    parts = []
+    current = []
+    size = 0
+    
+    for line in body.split('\n'):
+        line_size = len(line.encode('utf-8')) + 1  # +1 בשביל ה-\n
+        
+        if current and size + line_size > limit:
+            parts.append('\n'.join(current))
+            current = []
+            size = 0
+        
+        # שורה בודדת ארוכה מדי - חותכים אותה לפי תווים
+        while line_size > limit:
+            cut = len(line.encode('utf-8')[:limit - 1].decode('utf-8', 'ignore'))
+            parts.append(line[:cut])
+            line = line[cut:]
+            line_size = len(line.encode('utf-8')) + 1
+        
+        current.append(line)
+        size += line_size
+    
+    if current:
+        parts.append('\n'.join(current))
+    
+    return parts
+
 
 class TelegramAlerter:
     """
     מערכת התראות Telegram
     """
     
-    def __init__(self, bot_token: str, chat_id: str):
+    __slots__ = (
+        'bot_token', 'chat_id', 'base_url', '_url_send', '_url_me', 'max_retries',
+        '_session', '_limiter',
+        '_dedup', '_dedup_ttl', '_dedup_lock', '_dedup_flushed',
+        '_alert_path', '_dead_letter_path', '_alert_fd', '_journal_lock', '_journal_event',
+        '_drain_stop', '_drain_thread'
+    )
+    
+    # תבניות הודעה - כל הודעה נבנית ב-format_map אחד
+    _ALERT_TPL = "{emoji} *{severity} ALERT*\n\n*{title}*\n{description}\n{details}\n🕐 {ts}"
+    _DETAILS_TPL = "\n📋 *Details:*\n{lines}"
+    _NEW_DEVICE_TPL = (
+        "🆕 *NEW DEVICE DETECTED*\n\n"
+        "A new device has connected to your network!\n\n"
+        "📱 *Device Info:*\n"
+        "{device_lines}"
+        "\n🕐 {ts}"
+        "\n\n⚠️ If you don't recognize this device, it may be unauthorized!"
+    )
+    _DAILY_SUMMARY_TPL = (
+        "📊 *DAILY SECURITY SUMMARY*\n\n"
+        "🗓️ {date}\n\n"
+        "📈 *Statistics:*\n"
+        "{statistics}\n"
+        "🖥️ *Network:*\n"
+        "{network}\n"
+        "✅ System Status: {status}"
+    )
+    
+    # (תווית, מפתח) - שדות המכשיר בהתראת מכשיר חדש
+    _DEVICE_FIELDS = (
+        ('IP', 'ip'),
+        ('MAC', 'mac'),
+        ('Vendor', 'vendor'),
+        ('Type', 'type'),
+    )
+    
+    # (תווית, מפתח, ברירת מחדל) - שורות הסיכום היומי
+    _STATISTICS_FIELDS = (
+        ('Total Alerts', 'total_alerts', 0),
+        ('Critical', 'critical', 0),
+        ('High', 'high', 0),
+        ('Medium', 'medium', 0),
+        ('Low', 'low', 0),
+    )
+    _NETWORK_FIELDS = (
+        ('Active Devices', 'active_devices', 0),
+        ('New Devices', 'new_devices', 0),
+    )
+    
+    # כל כמה שניות ה-drain thread מנסה שוב כשטלגרם לא זמין
+    DRAIN_RETRY_SECONDS = 30
+    
+    # כמה מכשירים בהודעה אחת (מגבלת 4096 תווים של טלגרם)
+    BATCH_SIZE = 20
+    
+    _BATCH_NEW_DEVICES_TPL = (
+        "🆕 *NEW DEVICES DETECTED*{part}\n\n"
+        "{count} new device(s) have connected to your network:\n\n"
+        "{lines}"
+        "\n🕐 {ts}"
+        "\n\n⚠️ If you don't recognize these devices, they may be unauthorized!"
+    )
+    _SCAN_RESULTS_TPL = "🔍 *NETWORK SCAN COMPLETE*\n\nFound {count} device(s):\n\n{lines}\n\n🕐 {ts}"
+    
+    def __init__(
+        self,
+        bot_token: str,
+        chat_id: str,
+        rate_limit: Optional[dict] = None,
+        alert_log_dir: Optional[str] = None
+    ):
         """
         אתחול Telegram Bot
         
         Args:
             bot_token: Token של הבוט מ-@BotFather
             chat_id: Chat ID שלך (קבל ע"י get_chat_id)
+            rate_limit: הגדרות rate limit (telegram.rate_limit ב-config):
+                        max_retries, rate_per_second, rate_per_minute_per_chat
+            alert_log_dir: תיקייה ל-alerts.jsonl (ברירת מחדל: logs/)
         """
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.base_url = f"https://api.telegram.org/bot{bot_token}"
+        self._url_send = f"{self.base_url}/sendMessage"
+        self._url_me = f"{self.base_url}/getMe"
+        
+        # Rate limiting - לא לחרוג מהמגבלות של טלגרם
+        rate_limit = rate_limit or {}
+        self.max_retries = rate_limit.get('max_retries', 1)
+        self._limiter = TelegramRateLimiter(
+            rate_per_second=rate_limit.get('rate_per_second', DEFAULT_RATE_PER_SECOND),
+            rate_per_minute_per_chat=rate_limit.get('rate_per_minute_per_chat', DEFAULT_RATE_PER_MINUTE_PER_CHAT)
+        )
+        
+        # Session אחד לכל הבקשות - keep-alive חוסך TCP+TLS handshake לכל הודעה
+        self._session = requests.Session()
+        self._session.headers.update({"Connection": "keep-alive"})
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            # 5xx / connection reset - retry עם exponential backoff (0.5s, 1s, 2s)
+            # POST כלול - sendMessage הוא POST, ו-urllib3 לא עושה לו retry כברירת מחדל
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=frozenset({'GET', 'POST'}),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        ))
+        
+        # Dedup - אותה התראה לא נשלחת שוב תוך שעה
+        # alias -> (זמן שליחה אחרון, כמה כפילויות דוכאו)
+        self._dedup: Dict[str, Tuple[float, int]] = {}
+        self._dedup_ttl = 3600
+        self._dedup_lock = threading.Lock()
+        self._dedup_flushed = time.time()
+        
+        # Journal - כל התראה נכתבת קודם ל-alerts.jsonl (append-only),
+        # ו-thread ברקע שולח אותה לטלגרם. אם טלגרם לא זמין - ההתראה לא הולכת לאיבוד
+        log_dir = Path(alert_log_dir) if alert_log_dir else Path(__file__).parent.parent / 'logs'
+        self._alert_path = log_dir / 'alerts.jsonl'
+        self._dead_letter_path = log_dir / 'alerts.failed.jsonl'
+        self._journal_lock = threading.Lock()
+        self._journal_event = threading.Event()
+        self._drain_stop = threading.Event()
+        self._drain_thread = None
+        try:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            self._alert_fd = os.open(self._alert_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o640)
+        except OSError as e:
+            # אין journal - שולחים ישירות, בלי להפיל את כל המערכת
+            logger.error(f"Cannot open alert journal {self._alert_path}, sending alerts directly: {e}")
+            self._alert_fd = None
+        else:
+            self._journal_event.set()  # שלח מה שנשאר מהריצה הקודמת
+            self._drain_thread = threading.Thread(target=self._drain, name="telegram-drain", daemon=True)
+            self._drain_thread.start()
+        atexit.register(self.close)
         
         # Test connection
         if self.test_connection():
@@ -59,11 +305,10 @@ class TelegramAlerter:
             True אם עובד, False אם לא
         """
         try:
-            url = f"{self.base_url}/getMe"
-            response = requests.get(url, timeout=5)
+            response = self._session.get(self._url_me, timeout=5)
             
             if response.status_code == 200:
-                bot_info = response.json()['result']
+                bot_info = _json_loads(response.content)['result']
                 logger.info(f"Bot Name: {bot_info['first_name']}")
                 logger.info(f"Bot Username: @{bot_info['username']}")
                 return True
@@ -75,6 +320,122 @@ class TelegramAlerter:
             logger.error(f"Connection test failed: {e}")
             return False
     
+    def close(self):
+        """
+        שולח את מה שנשאר ב-journal, וסוגר את ה-Session וכל החיבורים הפתוחים
+        """
+        if self._drain_thread is not None and self._drain_thread.is_alive():
+            self._drain_stop.set()
+            self._journal_event.set()
+            self._drain_thread.join(timeout=10)
+        
+        with self._journal_lock:
+            if self._alert_fd is not None:
+                os.close(self._alert_fd)
+                self._alert_fd = None
+        
+        self._session.close()
+    
+    def _queue_message(self, message: str, disable_notification: bool = False) -> bool:
+        """
+        כותב הודעה ל-alerts.jsonl - ה-drain thread ישלח אותה
+        
+        אם ה-journal לא נפתח ב-__init__, שולח את ההודעה ישירות.
+        
+        Returns:
+            True אם נכתבה ל-journal (או נשלחה)
+        """
+        if self._drain_thread is None:
+            return self.send_message(message, disable_notification=disable_notification)
+        
+        record = _json_dumps({
+            "text": message,
+            "disable_notification": disable_notification,
+            "queued_at": time.time()
+        }) + b"\n"
+        
+        with self._journal_lock:
+            if self._alert_fd is None:
+                logger.error("Alert journal is closed, dropping alert")
+                return False
+            try:
+                os.write(self._alert_fd, record)
+            except OSError as e:
+                logger.error(f"Failed to write alert to journal: {e}")
+                return False
+        
+        self._journal_event.set()
+        return True
+    
+    def _drain(self):
+        """
+        Thread ברקע: שולח את ההתראות מ-alerts.jsonl לפי הסדר
+        
+        מתקדם בקובץ רק אחרי שליחה מוצלחת. כשהכל נשלח - מרוקן את הקובץ.
+        אם שליחה נכשלת זמנית, מנסה שוב אחרי DRAIN_RETRY_SECONDS.
+        הודעה שטלגרם דוחה (4xx) עוברת ל-alerts.failed.jsonl.
+        """
+        offset = 0
+        
+        while True:
+            self._journal_event.wait(timeout=self.DRAIN_RETRY_SECONDS)
+            self._journal_event.clear()
+            
+            try:
+                offset = self._drain_once(offset)
+            except Exception as e:
+                logger.error(f"Alert journal drain failed: {e}")
+            
+            if self._drain_stop.is_set():
+                break
+    
+    def _drain_once(self, offset: int) -> int:
+        """
+        שולח את כל ההתראות מ-offset ועד סוף הקובץ
+        
+        Returns:
+            ה-offset החדש (0 אם הקובץ רוקן)
+        """
+        with open(self._alert_path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # כתיבה חלקית - נחכה לשאר
+                
+                try:
+                    record = _json_loads(line)
+                except ValueError:
+                    logger.error("Skipping corrupt alert journal entry")
+                    offset += len(line)
+                    continue
+                
+                status = self._post(
+                    record["text"],
+                    disable_notification=record.get("disable_notification", False)
+                )
+                
+                # 4xx (חוץ מ-429) = טלגרם דחה את ההודעה עצמה (למשל Markdown שבור) -
+                # ניסיון חוזר לא יעזור, ואסור שהיא תתקע את כל ההתראות שאחריה
+                if status is not None and 400 <= status < 500 and status != 429:
+                    logger.error(
+                        f"Telegram rejected alert (HTTP {status}), moving it to {self._dead_letter_path.name}"
+                    )
+                    with open(self._dead_letter_path, 'ab') as dead_letter:
+                        dead_letter.write(line)
+                elif status != 200:
+                    # 5xx / 429 / אין רשת - זמני, ננסה שוב מאותה הודעה
+                    return offset
+                
+                offset += len(line)
+        
+        # הכל נשלח - מרוקנים את הקובץ (אם לא נכתב משהו חדש בינתיים)
+        with self._journal_lock:
+            if self._alert_fd is not None and os.fstat(self._alert_fd).st_size == offset:
+                os.ftruncate(self._alert_fd, 0)
+                return 0
+        
+        return offset
+    
     def send_message(
         self,
         message: str,
@@ -92,8 +453,21 @@ class TelegramAlerter:
         Returns:
             True אם נשלח בהצלחה
         """
+        return self._post(message, parse_mode, disable_notification) == 200
+    
+    def _post(
+        self,
+        message: str,
+        parse_mode: str = "Markdown",
+        disable_notification: bool = False
+    ) -> Optional[int]:
+        """
+        בקשת sendMessage (כולל המתנה ל-rate limiter ו-retry על 429)
+        
+        Returns:
+            ה-HTTP status של התשובה האחרונה, או None אם לא הייתה תשובה (שגיאת רשת)
+        """
         try:
-            url = f"{self.base_url}/sendMessage"
             data = {
                 "chat_id": self.chat_id,
                 "text": message,
@@ -101,67 +475,169 @@ class TelegramAlerter:
                 "disable_notification": disable_notification
             }
             
-            response = requests.post(url, json=data, timeout=10)
+            for attempt in range(self.max_retries + 1):
+                self._limiter.acquire(self.chat_id)
+                response = self._session.post(
+                    self._url_send, data=_json_dumps(data), headers=_JSON_HEADERS, timeout=10
+                )
+                
+                # 429 = Flood control - טלגרם אומר כמה לחכות
+                if response.status_code != 429 or attempt == self.max_retries:
+                    break
+                
+                retry_after = _json_loads(response.content).get('parameters', {}).get('retry_after', 1)
+                logger.warning(f"Telegram rate limit hit, retrying in {retry_after}s")
+                time.sleep(retry_after)
             
             if response.status_code == 200:
                 logger.debug("Message sent successfully")
-                return True
             else:
                 logger.error(f"Failed to send message: {response.text}")
-                return False
+            return response.status_code
                 
         except Exception as e:
             logger.error(f"Error sending message: {e}")
-            return False
+            return None
     
     def send_alert(
         self,
-        severity: str,
+        severity: Union[str, Severity],
         title: str,
         description: str,
-        details: Optional[dict] = None
+        details: Optional[dict] = None,
+        ts: Optional[float] = None
     ) -> bool:
         """
         שליחת התראת אבטחה מעוצבת
         
         Args:
-            severity: CRITICAL/HIGH/MEDIUM/LOW
+            severity: Severity או CRITICAL/HIGH/MEDIUM/LOW/INFO
             title: כותרת ההתראה
             description: תיאור
             details: מידע נוסף (dictionary)
+            ts: זמן האירוע (time.time()) - ברירת מחדל: עכשיו
             
         Returns:
-            True אם נשלח
+            True אם נכנס לתור השליחה (או שזו כפילות שדוכאה)
         """
-        # Emoji לפי severity
-        emoji_map = {
-            'CRITICAL': '🔴',
-            'HIGH': '🟠',
-            'MEDIUM': '🟡',
-            'LOW': '🔵',
-            'INFO': 'ℹ️'
-        }
+        level = Severity.parse(severity)
+        severity_name = level.name if level is not None else severity
         
-        emoji = emoji_map.get(severity, '⚠️')
+        if self.is_duplicate(f"alert:{title}", details or {}, severity_name, description):
+            return True
         
-        # בנה הודעה
-        message = f"{emoji} *{severity} ALERT*\n\n"
-        message += f"*{title}*\n"
-        message += f"{description}\n"
+        message = self.format_alert(severity, title, description, details, ts)
         
-        # הוסף פרטים
-        if details:
-            message += "\n📋 *Details:*\n"
-            for key, value in details.items():
-                message += f"  • {key}: `{value}`\n"
+        # שלח (בלי silent notification ל-HIGH ו-CRITICAL)
+        silent = _is_silent(severity)
         
-        # Timestamp
-        message += f"\n🕐 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        return self._queue_message(message, disable_notification=silent)
+    
+    @classmethod
+    def format_alert(
+        cls,
+        severity: Union[str, Severity],
+        title: str,
+        description: str,
+        details: Optional[dict] = None,
+        ts: Optional[float] = None
+    ) -> str:
+        """
+        בונה את טקסט התראת האבטחה (Markdown)
         
-        # שלח (בלי silent notification ל-HIGH ו-CRITICAL)
-        silent = severity in ['LOW', 'INFO']
+        Returns:
+            ההודעה המעוצבת
+        """
+        level = Severity.parse(severity)
+        
+        details_str = cls._DETAILS_TPL.format_map({
+            'lines': "".join(f"  • {key}: `{value}`\n" for key, value in details.items())
+        }) if details else ""
+        
+        return cls._ALERT_TPL.format_map({
+            'emoji': _EMOJIS[level] if level is not None else '⚠️',
+            'severity': level.name if level is not None else severity,
+            'title': title,
+            'description': description,
+            'details': details_str,
+            'ts': _fmt_ts(ts)
+        })
+    
+    @staticmethod
+    def _alias(kind: str, payload: dict, severity: str = '', description: str = '') -> str:
+        """
+        מזהה יציב להתראה - אותו סוג + אותו מכשיר + אותה חומרה = אותה התראה
+        
+        בלי mac / ip אין מכשיר לזהות לפיו - אז התיאור וכל הפרטים (ממוינים)
+        הם חלק מהמזהה, כדי ששני אירועים שונים מאותו חוק לא ייחשבו כפילות.
+        """
+        key = payload.get('mac') or payload.get('ip')
+        if not key:
+            key = f"{description}:{sorted((str(k), str(v)) for k, v in payload.items())}"
+        return hashlib.blake2b(
+            f"{kind}:{key}:{severity}".encode(), digest_size=16
+        ).hexdigest()
+    
+    def is_duplicate(self, kind: str, payload: dict, severity: str = '', description: str = '') -> bool:
+        """
+        בודק אם ההתראה כבר נשלחה בשעה האחרונה
+        
+        כפילות לא נשלחת - רק מעלה מונה. פעם בשעה נשלח סיכום
+        של כמה כפילויות דוכאו.
+        
+        Args:
+            kind: סוג ההתראה
+            payload: פרטי ההתראה (mac / ip)
+            severity: חומרה
+            description: תיאור ההתראה (משמש לזיהוי כשאין mac / ip)
+            
+        Returns:
+            True אם זו כפילות (לא לשלוח)
+        """
+        alias = self._alias(kind, payload, severity, description)
+        now = time.time()
+        
+        with self._dedup_lock:
+            entry = self._dedup.get(alias)
+            if entry and now - entry[0] < self._dedup_ttl:
+                self._dedup[alias] = (entry[0], entry[1] + 1)
+                duplicate = True
+            else:
+                self._dedup[alias] = (now, 0)
+                duplicate = False
+            
+            suppressed = self._flush_dedup(now)
+        
+        if suppressed:
+            self.send_message(
+                f"🔁 Suppressed {suppressed} duplicate alert(s) in the last hour",
+                disable_notification=True
+            )
+        
+        if duplicate:
+            logger.debug(f"Suppressed duplicate {kind} alert")
+        return duplicate
+    
+    def _flush_dedup(self, now: float) -> int:
+        """
+        פעם בשעה: מאפס מונים ומוחק רשומות שפג תוקפן
         
-        return self.send_message(message, disable_notification=silent)
+        נקרא כש-_dedup_lock תפוס.
+        
+        Returns:
+            כמה כפילויות דוכאו מאז ה-flush הקודם (0 אם עוד לא הגיע הזמן)
+        """
+        if now - self._dedup_flushed < self._dedup_ttl:
+            return 0
+        
+        suppressed = sum(count for _, count in self._dedup.values())
+        self._dedup = {
+            alias: (ts, 0)
+            for alias, (ts, _) in self._dedup.items()
+            if now - ts < self._dedup_ttl
+        }
+        self._dedup_flushed = now
+        return suppressed
     
     def send_security_alert(self, alert_data: dict) -> bool:
         """
@@ -180,86 +656,146 @@ class TelegramAlerter:
             details=alert_data.get('details', {})
         )
     
-    def send_new_device_alert(self, device: dict) -> bool:
+    def send_new_device_alert(self, device: dict, ts: Optional[float] = None) -> bool:
         """
         התראה על מכשיר חדש ברשת
         
         Args:
             device: מידע על המכשיר
+            ts: זמן הסריקה (time.time()) - ברירת מחדל: עכשיו
             
         Returns:
-            True אם נשלח
+            True אם נכנס לתור השליחה (או שזו כפילות שדוכאה)
+        """
+        if self.is_duplicate("new_device", device):
+            return True
+        
+        message = self.format_new_device_alert(device, ts)
+        
+        return self._queue_message(message, disable_notification=False)
+    
+    @classmethod
+    def format_new_device_alert(cls, device: dict, ts: Optional[float] = None) -> str:
         """
-        message = "🆕 *NEW DEVICE DETECTED*\n\n"
-        message += f"A new device has connected to your network!\n\n"
-        message += f"📱 *Device Info:*\n"
-        message += f"  • IP: `{device['ip']}`\n"
-        message += f"  • MAC: `{device.get('mac', 'Unknown')}`\n"
-        message += f"  • Vendor: `{device.get('vendor', 'Unknown')}`\n"
-        message += f"  • Type: `{device.get('type', 'Unknown')}`\n"
+        בונה את טקסט ההתראה על מכשיר חדש (Markdown)
         
+        Returns:
+            ההודעה המעוצבת
+        """
+        device_lines = "".join(
+            f"  • {label}: `{device.get(key, 'Unknown')}`\n"
+            for label, key in cls._DEVICE_FIELDS
+        )
         if device.get('hostname'):
-            message += f"  • Name: `{device['hostname']}`\n"
+            device_lines += f"  • Name: `{device['hostname']}`\n"
         
-        message += f"\n🕐 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        message += f"\n\n⚠️ If you don't recognize this device, it may be unauthorized!"
+        return cls._NEW_DEVICE_TPL.format_map({
+            'device_lines': device_lines,
+            'ts': _fmt_ts(ts)
+        })
+    
+    def send_batched_new_device_alert(
+        self,
+        devices: List[dict],
+        ts: Optional[float] = None
+    ) -> bool:
+        """
+        התראה אחת על כמה מכשירים חדשים (במקום הודעה לכל מכשיר)
+        
+        מעל 20 מכשירים ההודעה מתפצלת לכמה הודעות,
+        כדי לא לעבור את מגבלת 4096 התווים של טלגרם.
         
-        return self.send_message(message, disable_notification=False)
+        Args:
+            devices: רשימת המכשירים החדשים
+            ts: זמן הסריקה (time.time()) - ברירת מחדל: עכשיו
+            
+        Returns:
+            True אם הכל נכנס לתור השליחה (או שכולם כפילויות שדוכאו)
+        """
+        devices = [d for d in devices if not self.is_duplicate("new_device", d)]
+        if not devices:
+            return True
+        
+        # מכשיר אחד - ההודעה המפורטת הרגילה
+        if len(devices) == 1:
+            return self._queue_message(
+                self.format_new_device_alert(devices[0], ts),
+                disable_notification=False
+            )
+        
+        chunks = [devices[i:i + self.BATCH_SIZE] for i in range(0, len(devices), self.BATCH_SIZE)]
+        ok = True
+        for index, chunk in enumerate(chunks, 1):
+            message = self._BATCH_NEW_DEVICES_TPL.format_map({
+                'part': f" ({index}/{len(chunks)})" if len(chunks) > 1 else "",
+                'count': len(chunk),
+                'lines': "".join(self._device_line(device) for device in chunk),
+                'ts': _fmt_ts(ts)
+            })
+            ok = self._queue_message(message, disable_notification=False) and ok
+        
+        return ok
     
-    def send_daily_summary(self, stats: dict) -> bool:
+    def send_daily_summary(self, stats: dict, ts: Optional[float] = None) -> bool:
         """
         סיכום יומי
         
         Args:
             stats: סטטיסטיקות היום
+            ts: זמן הסיכום (time.time()) - ברירת מחדל: עכשיו
             
         Returns:
             True אם נשלח
         """
-        message = "📊 *DAILY SECURITY SUMMARY*\n\n"
-        message += f"🗓️ {datetime.now().strftime('%Y-%m-%d')}\n\n"
-        
-        message += f"📈 *Statistics:*\n"
-        message += f"  • Total Alerts: {stats.get('total_alerts', 0)}\n"
-        message += f"  • Critical: {stats.get('critical', 0)}\n"
-        message += f"  • High: {stats.get('high', 0)}\n"
-        message += f"  • Medium: {stats.get('medium', 0)}\n"
-        message += f"  • Low: {stats.get('low', 0)}\n\n"
-        
-        message += f"🖥️ *Network:*\n"
-        message += f"  • Active Devices: {stats.get('active_devices', 0)}\n"
-        message += f"  • New Devices: {stats.get('new_devices', 0)}\n\n"
-        
-        message += f"✅ System Status: {'🟢 All Good' if stats.get('total_alerts', 0) == 0 else '🟠 Requires Attention'}"
+        message = self._DAILY_SUMMARY_TPL.format_map({
+            'date': _fmt_ts(ts, '%Y-%m-%d'),
+            'statistics': "".join(
+                f"  • {label}: {stats.get(key, default)}\n"
+                for label, key, default in self._STATISTICS_FIELDS
+            ),
+            'network': "".join(
+                f"  • {label}: {stats.get(key, default)}\n"
+                for label, key, default in self._NETWORK_FIELDS
+            ),
+            'status': '🟢 All Good' if stats.get('total_alerts', 0) == 0 else '🟠 Requires Attention'
+        })
         
         return self.send_message(message, disable_notification=True)
     
-    def send_scan_results(self, devices: List[dict]) -> bool:
+    def send_scan_results(self, devices: List[dict], ts: Optional[float] = None) -> bool:
         """
         שליחת תוצאות סריקת רשת
         
         Args:
             devices: רשימת מכשירים
+            ts: זמן הסריקה (time.time()) - ברירת מחדל: עכשיו
             
         Returns:
             True אם נשלח
         """
-        message = "🔍 *NETWORK SCAN COMPLETE*\n\n"
-        message += f"Found {len(devices)} device(s):\n\n"
-        
-        for device in devices[:10]:  # רק 10 ראשונים (הגבלת אורך)
-            status = "🆕" if device.get('is_new') else "✅"
-            message += f"{status} `{device['ip']}`"
-            if device.get('hostname'):
-                message += f" - {device['hostname']}"
-            message += f" ({device.get('vendor', 'Unknown')})\n"
+        message = self._SCAN_RESULTS_TPL.format_map({
+            'count': len(devices),
+            'lines': "".join(self._device_line(device) for device in devices),
+            'ts': _fmt_ts(ts, '%H:%M:%S')
+        })
         
-        if len(devices) > 10:
-            message += f"\n... and {len(devices) - 10} more devices"
+        # רשימה ארוכה נשלחת בכמה הודעות (דרך ה-rate limiter)
+        ok = True
+        for part in _split_markdown(message):
+            ok = self.send_message(part, disable_notification=True) and ok
         
-        message += f"\n\n🕐 {datetime.now().strftime('%H:%M:%S')}"
-        
-        return self.send_message(message, disable_notification=True)
+        return ok
+    
+    @staticmethod
+    def _device_line(device: dict) -> str:
+        """
+        שורה אחת לכל מכשיר: סטטוס, IP, שם ויצרן
+        """
+        return (
+            f"{'🆕' if device.get('is_new') else '✅'} {_code(device['ip'])}"
+            f"{' - ' + _code(device['hostname']) if device.get('hostname') else ''}"
+            f" ({_code(device.get('vendor', 'Unknown'))})\n"
+        )
     
     @staticmethod
     def get_chat_id(bot_token: str) -> Optional[str]:
@@ -278,13 +814,14 @@ class TelegramAlerter:
             CHAT_ID או None
         """
         try:
-            url = f"https://api.telegram.org/bot{bot_token}/getUpdates"
-            response = requests.get(url)
+            # רק העדכון האחרון - לא כל ההיסטוריה (עד 100 עדכונים)
+            url = f"https://api.telegram.org/bot{bot_token}/getUpdates?offset=-1&limit=1&timeout=0"
+            response = requests.get(url, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 if data['result']:
-                    chat_id = data['result'][0]['message']['chat']['id']
+                    chat_id = data['result'][-1]['message']['chat']['id']
                     print(f"✅ Your CHAT_ID: {chat_id}")
                     print(f"   Save this in your config file!")
                     return str(chat_id)
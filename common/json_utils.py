@@ -0,0 +1,28 @@
+"""
+JSON - orjson אם מותקן, אחרת json הרגיל
+=========================================
+
+orjson אופציונלי - מהיר יותר מ-json ומחזיר bytes ישירות.
+כל הפונקציות כאן מחזירות bytes בשני המקרים.
+"""
+
+import json
+
+try:
+    import orjson
+    
+    json_loads = orjson.loads
+    
+    def json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+    
+    def json_dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    json_loads = json.loads
+    
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    
+    def json_dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
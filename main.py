@@ -21,18 +21,23 @@ Usage:
 import sys
 import os
 import time
+import atexit
+import queue
 import logging
+import logging.handlers
 import argparse
+import asyncio
+import signal
 from pathlib import Path
 from datetime import datetime
-import yaml
 
 # הוסף את src ל-path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# yaml ו-TelegramAlerter (requests) נטענים רק כשצריך אותם -
+# חוסך זמן עלייה ב---scan-once
 try:
     from scanners.network_scanner import NetworkScanner
-    from alerting.telegram_bot import TelegramAlerter
 except ImportError as e:
     print(f"❌ Error importing modules: {e}")
     print("Make sure you're running from the thetawatch-home directory")
@@ -44,6 +49,11 @@ class ThetaWatchHome:
     ThetaWatch Home SIEM - מערכת ניטור אבטחה ביתית
     """
     
+    __slots__ = (
+        'config_file', 'config', 'scanner', 'alerter', 'running',
+        'log_dir', '_log_listener', '_stop_event'
+    )
+    
     def __init__(self, config_file: str = "../config/config.yaml"):
         """
         אתחול המערכת
@@ -56,6 +66,9 @@ class ThetaWatchHome:
         self.scanner = None
         self.alerter = None
         self.running = False
+        self.log_dir = None
+        self._log_listener = None
+        self._stop_event = None
         
         # Setup logging
         self.setup_logging()
@@ -71,24 +84,44 @@ class ThetaWatchHome:
         הגדרת מערכת לוגים
         """
         # צור תיקיית logs
-        log_dir = Path(__file__).parent.parent / 'logs'
-        log_dir.mkdir(exist_ok=True)
+        self.log_dir = Path(__file__).parent.parent / 'logs'
+        self.log_dir.mkdir(exist_ok=True)
         
         # הגדר logging
-        log_file = log_dir / 'thetawatch_home.log'
+        log_file = self.log_dir / 'thetawatch_home.log'
+        
+        # הכתיבה לקובץ/מסך נעשית ב-thread נפרד (QueueListener),
+        # ה-thread הראשי רק מכניס את הרשומה לתור
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
         
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler(sys.stdout)
-            ]
+            handlers=[queue_handler]
         )
         
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+        self._log_listener.start()
+        atexit.register(self.stop_logging)
+        
         global logger
         logger = logging.getLogger(__name__)
     
+    def stop_logging(self):
+        """
+        עוצר את ה-QueueListener (כותב את כל מה שנשאר בתור)
+        """
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+    
     def load_config(self):
         """
         טעינת קובץ config
@@ -97,18 +130,26 @@ class ThetaWatchHome:
             config_path = Path(__file__).parent / self.config_file
             
             if not config_path.exists():
-                logger.warning(f"Config file not found: {config_path}")
+                logger.warning("Config file not found: %s", config_path)
                 logger.info("Using default configuration...")
                 self.config = self.get_default_config()
                 return
             
+            import yaml
+            
+            # libyaml (C) אם מותקן - הרבה יותר מהיר מה-loader של Python
+            try:
+                from yaml import CSafeLoader as SafeLoader
+            except ImportError:
+                from yaml import SafeLoader
+            
             with open(config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+                self.config = yaml.load(f, Loader=SafeLoader)
             
             logger.info("✅ Configuration loaded successfully")
             
         except Exception as e:
-            logger.error(f"Failed to load config: {e}")
+            logger.error("Failed to load config: %s", e)
             logger.info("Using default configuration...")
             self.config = self.get_default_config()
     
@@ -123,7 +164,12 @@ class ThetaWatchHome:
             },
             'telegram': {
                 'enabled': False,
-                'send_new_device_alerts': True
+                'send_new_device_alerts': True,
+                'rate_limit': {
+                    'max_retries': 1,
+                    'rate_per_second': 25,
+                    'rate_per_minute_per_chat': 20
+                }
             },
             'detection': {
                 'unknown_device': {
@@ -147,7 +193,7 @@ class ThetaWatchHome:
             logger.info("Creating Network Scanner...")
             network = self.config.get('network', {}).get('home_network', '192.168.1.0/24')
             self.scanner = NetworkScanner(network=network)
-            logger.info(f"Network Scanner ready (monitoring {network})")
+            logger.info("Network Scanner ready (monitoring %s)", ', '.join(self.scanner.networks))
             
             # 2. Telegram Alerter (אם מופעל)
             telegram_config = self.config.get('telegram', {})
@@ -157,7 +203,14 @@ class ThetaWatchHome:
                 chat_id = telegram_config.get('chat_id', '')
                 
                 if bot_token and chat_id and bot_token != 'YOUR_BOT_TOKEN_HERE':
-                    self.alerter = TelegramAlerter(bot_token, chat_id)
+                    from alerting.telegram_bot import TelegramAlerter
+                    
+                    self.alerter = TelegramAlerter(
+                        bot_token,
+                        chat_id,
+                        rate_limit=telegram_config.get('rate_limit', {}),
+                        alert_log_dir=self.log_dir
+                    )
                     logger.info("Telegram Alerter ready")
                 else:
                     logger.warning("Telegram not configured (add bot_token and chat_id to config)")
@@ -172,7 +225,7 @@ class ThetaWatchHome:
             logger.info("="*70)
             
         except Exception as e:
-            logger.error(f"Failed to initialize components: {e}")
+            logger.error("Failed to initialize components: %s", e)
             raise
     
     def scan_network_once(self):
@@ -187,6 +240,9 @@ class ThetaWatchHome:
             # סרוק את הרשת
             devices = self.scanner.scan_network()
             
+            # זמן אחד לכל ההתראות של הסריקה הזו
+            scan_ts = time.time()
+            
             # הדפס תוצאות
             self.scanner.print_devices()
             
@@ -194,69 +250,93 @@ class ThetaWatchHome:
             new_devices = [d for d in devices if d.get('is_new', False)]
             
             if new_devices:
-                logger.warning(f"\nNEW DEVICE(S) FOUND: {len(new_devices)}")
+                logger.warning("\nNEW DEVICE(S) FOUND: %d", len(new_devices))
                 
-                # שלח התראות Telegram
+                # שלח התראת Telegram אחת לכל המכשירים החדשים
                 if self.alerter:
-                    for device in new_devices:
-                        logger.info(f"Sending Telegram alert for {device['ip']}")
-                        self.alerter.send_new_device_alert(device)
+                    logger.info("Sending Telegram alert for %d device(s)", len(new_devices))
+                    self.alerter.send_batched_new_device_alert(new_devices, ts=scan_ts)
                 
                 # שאל אם להוסיף למכשירים מוכרים
                 if not self.running:  # רק במצב interactive
                     try:
                         answer = input("\n❓ Add new devices to known list? (y/n): ")
                         if answer.lower() == 'y':
-                            for device in new_devices:
-                                self.scanner.add_to_known_devices(device)
+                            self.scanner.add_many_to_known_devices(new_devices)
                             logger.info("✅ New devices added to known list!")
                     except (EOFError, KeyboardInterrupt):
                         logger.info("\nSkipping device approval...")
             
             # שלח סיכום Telegram (אם מופעל)
             if self.alerter and self.config.get('telegram', {}).get('send_scan_results', False):
-                self.alerter.send_scan_results(devices)
+                self.alerter.send_scan_results(devices, ts=scan_ts)
             
             return devices
             
         except Exception as e:
-            logger.error(f"Network scan failed: {e}")
+            logger.error("Network scan failed: %s", e)
             return []
     
     def run_daemon(self):
         """
         מצב Daemon - רץ ברקע ללא הפסקה
         """
+        try:
+            asyncio.run(self._run_daemon_async())
+        except KeyboardInterrupt:
+            logger.info("\n\n⚠️  Daemon stopped by user")
+            self.running = False
+    
+    async def _run_daemon_async(self):
+        """
+        לולאת ה-Daemon על asyncio
+        
+        הסריקה רצה ב-thread נפרד, וההמתנה בין סריקות נקטעת מיד
+        כש-Ctrl+C / SIGTERM מגיעים.
+        """
         logger.info("\n" + "="*70)
         logger.info("Starting Daemon Mode (24/7 Monitoring)")
         logger.info("="*70)
         logger.info("Press Ctrl+C to stop\n")
         
         self.running = True
+        self._stop_event = asyncio.Event()
         scan_interval = self.config.get('network', {}).get('scan_interval_minutes', 5)
         
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._stop_event.set)
+            except (NotImplementedError, RuntimeError):
+                # Windows - נשארים עם KeyboardInterrupt הרגיל
+                pass
+        
         scan_count = 0
         
-        try:
-            while self.running:
-                scan_count += 1
-                
-                logger.info(f"\n{'='*70}")
-                logger.info(f"Scan #{scan_count} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                logger.info(f"{'='*70}")
-                
-                # סרוק את הרשת
-                devices = self.scan_network_once()
-                
-                # המתן לסריקה הבאה
-                logger.info(f"\nSleeping for {scan_interval} minute(s)...")
-                logger.info(f"   Next scan: {datetime.now().strftime('%H:%M')} + {scan_interval} min")
-                
-                time.sleep(scan_interval * 60)
-                
-        except KeyboardInterrupt:
-            logger.info("\n\n⚠️  Daemon stopped by user")
-            self.running = False
+        while not self._stop_event.is_set():
+            scan_count += 1
+            
+            logger.info("\n%s", "="*70)
+            logger.info("Scan #%d - %s", scan_count, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            logger.info("="*70)
+            
+            # סרוק את הרשת (ב-thread, ה-event loop ממשיך לטפל בסיגנלים)
+            devices = await loop.run_in_executor(None, self.scan_network_once)
+            
+            if self._stop_event.is_set():
+                break
+            
+            # המתן לסריקה הבאה
+            logger.info("\nSleeping for %s minute(s)...", scan_interval)
+            logger.info("   Next scan: %s + %s min", datetime.now().strftime('%H:%M'), scan_interval)
+            
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=scan_interval * 60)
+            except asyncio.TimeoutError:
+                pass
+        
+        logger.info("\n\n⚠️  Daemon stopped by user")
+        self.running = False
     
     def print_welcome(self):
         """
@@ -278,7 +358,8 @@ class ThetaWatchHome:
 📱 Telegram Alerts: {telegram}
 
 """.format(
-            network=self.config.get('network', {}).get('home_network', '192.168.1.0/24'),
+            network=', '.join(self.scanner.networks) if self.scanner else
+                self.config.get('network', {}).get('home_network', '192.168.1.0/24'),
             interval=self.config.get('network', {}).get('scan_interval_minutes', 5),
             telegram='✅ Enabled' if self.alerter else '❌ Disabled'
         ))
@@ -293,6 +374,12 @@ class ThetaWatchHome:
         logger.info("ThetaWatch Home SIEM session ended")
         logger.info("Logs saved to: logs/thetawatch_home.log")
         logger.info("="*70 + "\n")
+        
+        # קודם ה-alerter (drain אחרון של ה-journal) - כדי ששגיאות ממנו עוד ייכתבו ללוג
+        if self.alerter:
+            self.alerter.close()
+        
+        self.stop_logging()
 
 
 def main():
@@ -16,33 +16,165 @@ Network Scanner - סורק רשת ביתית
 - nmap: advanced scanning (אופציונלי)
 """
 
+import asyncio
 import subprocess
 import re
-import json
+from concurrent.futures import ThreadPoolExecutor
+import os
+import platform
 import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple, Union
 import logging
 
+# הרצה ישירה (python3 scanners/network_scanner.py) - שורש הפרויקט ל-sys.path, כמו ב-main.py
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.json_utils import json_dumps_pretty as _json_dumps_pretty, json_loads as _json_loads
+from scanners.oui_db import OUIDatabase
+
 logger = logging.getLogger(__name__)
 
+KNOWN_DEVICES_FILE = '../data/known_devices.json'
+
+
+# icmplib אופציונלי - PING לכל ה-IPs מתוך התהליך, בלי subprocess
+try:
+    from icmplib import multiping, ICMPLibError
+    ICMPLIB_AVAILABLE = True
+except ImportError:
+    ICMPLIB_AVAILABLE = False
+
+# שורה ב-arp -a: "192.168.1.1  aa-bb-cc-dd-ee-ff" (Windows) / "? (192.168.1.1) at aa:bb:cc:dd:ee:ff" (Mac)
+# bytes - מפרסרים את הפלט של arp בלי decode
+_ARP_ENTRY_RE = re.compile(
+    rb'(\d{1,3}(?:\.\d{1,3}){3})\D+?((?:[0-9A-Fa-f]{1,2}[:-]){5}[0-9A-Fa-f]{1,2})'
+)
+
+@lru_cache(maxsize=1)
+def _load_scapy():
+    """
+    scapy אופציונלי - מאפשר ARP sweep בבקשה אחת במקום ping לכל IP
+    
+    נטען רק בסריקת ה-ARP הראשונה: import של scapy.all לוקח זמן,
+    ואין סיבה לשלם עליו בכל הפעלה של main.py.
+    
+    Returns:
+        (ARP, Ether, srp, Scapy_Exception), או None אם scapy לא מותקן
+    """
+    try:
+        from scapy.all import ARP, Ether, srp
+        from scapy.error import Scapy_Exception
+    except ImportError:
+        return None
+    return ARP, Ether, srp, Scapy_Exception
+
+
+# כמה זמן (שניות) לזכור תוצאת reverse DNS - כולל תוצאות שליליות
+HOSTNAME_CACHE_TTL = 3600
+
+
+@lru_cache(maxsize=1024)
+def _resolve(ip: str, ttl_bucket: int) -> str:
+    """
+    reverse DNS עם cache
+    
+    ttl_bucket משתנה כל HOSTNAME_CACHE_TTL שניות, כך שהתוצאה נשמרת
+    לכל היותר שעה. IP בלי PTR מחזיר "" ולא None - כדי שגם הכישלון
+    (שיכול לקחת כמה שניות של timeout) יישמר ב-cache.
+    """
+    try:
+        return socket.gethostbyaddr(ip)[0]
+    except socket.herror:
+        return ""
+
+
+# זיהוי סוג מכשיר - לפי הסדר, ההתאמה הראשונה קובעת
+_HOSTNAME_RULES = (
+    ('iphone', 'Mobile Device (iOS)'),
+    ('ipad', 'Mobile Device (iOS)'),
+    ('android', 'Mobile Device (Android)'),
+    ('laptop', 'Computer'),
+    ('pc', 'Computer'),
+    ('tv', 'Smart TV'),
+    ('router', 'Router'),
+)
+
+_VENDOR_RULES = (
+    ('apple', 'Apple Device'),
+    ('raspberry', 'Raspberry Pi'),
+    ('samsung', 'Samsung Device'),
+    ('google', 'Google Device'),
+)
+
+
+@dataclass
+class DeviceRecord:
+    """
+    מה שידוע על IP אחד מכל שלבי הגילוי (ARP / ping / DNS)
+    
+    כל שלב ממלא רק את מה שהוא יודע - השאר נשאר None.
+    """
+    ip: str
+    mac: Optional[str] = None
+    hostname: Optional[str] = None
+    
+    def merge(self, other: 'DeviceRecord'):
+        """
+        משלים שדות חסרים מרשומה אחרת של אותו IP
+        
+        Args:
+            other: רשומה נוספת על אותו IP
+        """
+        if self.mac is None:
+            self.mac = other.mac
+        if self.hostname is None:
+            self.hostname = other.hostname
+
 
 class NetworkScanner:
     """
     סורק רשת ביתית ומזהה מכשירים
     """
     
-    def __init__(self, network: str = "192.168.1.0/24"):
+    # כמה תהליכי ping פתוחים בו-זמנית ב-ping sweep
+    PING_CONCURRENCY = 128
+    
+    def __init__(self, network: Union[str, List[str]] = "192.168.1.0/24"):
         """
         אתחול Scanner
         
         Args:
-            network: טווח הרשת לסריקה (CIDR notation)
+            network: טווח הרשת לסריקה (CIDR notation), או רשימת רשתות
+                    (למשל כמה interfaces) - כולן נסרקות במקביל
                     192.168.1.0/24 = 192.168.1.1 - 192.168.1.254
         """
-        self.network = network
+        self.networks: List[str] = [network] if isinstance(network, str) else list(network)
+        if not self.networks:
+            raise ValueError("No network to scan - set network.home_network in the config")
+        self.network = self.networks[0]
+        
+        # זיהוי מערכת הפעלה ופקודת ה-ping - פעם אחת, לא בכל סריקה
+        self._is_windows = platform.system().lower() == 'windows'
+        if self._is_windows:
+            # Windows: ping -n 1 -w 1000 (ב-Windows -n = מספר פקטות, לא numeric.
+            # אין reverse DNS כי אנחנו לא מעבירים -a)
+            self._ping_base: Tuple[str, ...] = ('ping', '-n', '1', '-w', '1000')
+        else:
+            # Linux/Mac: ping -n -c 1 -W 1 (-n = numeric, בלי reverse DNS לכל תשובה)
+            self._ping_base = ('ping', '-n', '-c', '1', '-W', '1')
         self.devices = []
+        self._records: Dict[str, DeviceRecord] = {}
+        self._arp_cache: Optional[Dict[str, str]] = None
         self.known_devices = self.load_known_devices()
+        self._known_devices_lock = threading.Lock()
         
         # OUI Database - מזהה יצרן לפי MAC
         # 3 בתים ראשונים של MAC = Organization Unique Identifier
@@ -65,6 +197,18 @@ class NetworkScanner:
             '00:25:00': 'Apple',
             '00:26:08': 'Apple',
         }
+        
+        # אותו מידע לפי OUI כמספר של 24 ביט - lookup אחד בלי פירוק מחרוזות
+        self._oui_map: Dict[int, str] = {
+            int(oui.replace(':', ''), 16): vendor for oui, vendor in self.vendor_db.items()
+        }
+        
+        # מאגר IEEE המלא (data/oui.bin) - ל-MACs שלא ב-vendor_db
+        try:
+            self._oui_db: Optional[OUIDatabase] = OUIDatabase()
+        except (OSError, ValueError) as e:
+            logger.info(f"Full OUI database not available ({e}), using built-in vendor list")
+            self._oui_db = None
     
     def load_known_devices(self) -> Dict:
         """
@@ -74,8 +218,8 @@ class NetworkScanner:
             Dictionary של מכשירים מוכרים
         """
         try:
-            with open('../data/known_devices.json', 'r') as f:
-                return json.load(f)
+            with open(KNOWN_DEVICES_FILE, 'rb') as f:
+                return _json_loads(f.read())
         except FileNotFoundError:
             logger.info("No known devices file found, starting fresh")
             return {}
@@ -83,66 +227,237 @@ class NetworkScanner:
     def save_known_devices(self):
         """
         שומר מכשירים מוכרים לקובץ
+        
+        כותב לקובץ זמני ומחליף - קריסה באמצע לא משאירה קובץ חתוך
         """
+        tmp_path = KNOWN_DEVICES_FILE + '.tmp'
         try:
-            with open('../data/known_devices.json', 'w') as f:
-                json.dump(self.known_devices, f, indent=2)
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps_pretty(self.known_devices))
+            os.replace(tmp_path, KNOWN_DEVICES_FILE)
             logger.info(f"Saved {len(self.known_devices)} known devices")
         except Exception as e:
             logger.error(f"Failed to save known devices: {e}")
     
-    def ping_sweep(self) -> List[str]:
+    def ping_sweep(self, network: Optional[str] = None) -> List[str]:
         """
         סריקת PING לכל הרשת
         
         מוצא אילו IPs פעילים
         
+        Args:
+            network: הרשת לסריקה (ברירת מחדל: self.network)
+        
         Returns:
             רשימת IPs פעילים
         """
-        logger.info(f"Starting ping sweep on {self.network}")
+        network = network or self.network
+        logger.info(f"Starting ping sweep on {network}")
         
         # חלץ את הprefix (192.168.1)
-        base_ip = '.'.join(self.network.split('.')[:-1])
+        base_ip = '.'.join(network.split('.')[:-1])
         
-        active_ips = []
+        # סרוק 1-254 (דלג על 0 ו-255)
+        ips = [f"{base_ip}.{i}" for i in range(1, 255)]
+        
+        # מכשיר שכבר יש לו MAC ב-ARP table פעיל - לא צריך לחכות לו ב-PING
+        arp_table = self._load_arp_table()
+        active_ips = [ip for ip in ips if ip in arp_table]
+        targets = [ip for ip in ips if ip not in arp_table]
+        
+        if active_ips:
+            logger.debug(f"{len(active_ips)} devices already in ARP table, pinging {len(targets)} IPs")
+        
+        if not targets:
+            logger.info(f"Ping sweep complete: {len(active_ips)} active devices")
+            return active_ips
+        
+        # icmplib שולח את כל ה-PINGs מתוך התהליך עצמו - בלי לפתוח תהליכים
+        icmp_active = self._icmplib_sweep(targets)
+        if icmp_active is not None:
+            active_ips.extend(icmp_active)
+            logger.info(f"Ping sweep complete (icmplib): {len(active_ips)} active devices")
+            return active_ips
+        
+        # fping סורק את כל ה-IPs בתהליך אחד, אם מותקן
+        fping_active = self._fping_sweep(targets)
+        if fping_active is not None:
+            active_ips.extend(fping_active)
+            logger.info(f"Ping sweep complete (fping): {len(active_ips)} active devices")
+            return active_ips
+        
+        # כל ה-PINGs במקביל - תהליכים אסינכרוניים על event loop אחד, בלי thread לכל PING
+        results = asyncio.run(self._ping_all(targets))
+        for ip, alive in zip(targets, results):
+            if alive:
+                active_ips.append(ip)
+                logger.debug(f"Found active device: {ip}")
         
-        # זיהוי מערכת הפעלה
-        import platform
-        is_windows = platform.system().lower() == 'windows'
+        logger.info(f"Ping sweep complete: {len(active_ips)} active devices")
+        return active_ips
+    
+    def _icmplib_sweep(self, ips: List[str]) -> Optional[List[str]]:
+        """
+        סריקת PING עם icmplib - ICMP ישירות מה-socket, בלי subprocess
         
-        # סרוק 1-254 (דלג על 0 ו-255)
-        for i in range(1, 255):
-            ip = f"{base_ip}.{i}"
+        privileged=False = בלי root (ב-Linux דורש ש-net.ipv4.ping_group_range
+        יכלול את המשתמש - אחרת נופלים ל-fping / ping).
+        
+        Args:
+            ips: ה-IPs לבדיקה
+        
+        Returns:
+            רשימת IPs פעילים, או None אם icmplib לא זמין / אין הרשאות
+        """
+        if not ICMPLIB_AVAILABLE:
+            return None
+        
+        try:
+            hosts = multiping(ips, count=1, timeout=1, concurrent_tasks=128, privileged=False)
+        except (ICMPLibError, OSError) as e:
+            logger.debug(f"icmplib ping failed ({e}), falling back to ping")
+            return None
+        
+        return [host.address for host in hosts if host.is_alive]
+    
+    def _fping_sweep(self, ips: List[str]) -> Optional[List[str]]:
+        """
+        סריקת PING עם fping - תהליך אחד לכל ה-IPs
+        
+        fping שולח ICMP לכל ה-IPs מאותו socket, בלי DNS (-A),
+        במקום תהליך ping נפרד לכל IP.
+        
+        Args:
+            ips: ה-IPs לבדיקה
+        
+        Returns:
+            רשימת IPs פעילים, או None אם fping לא זמין
+        """
+        try:
+            result = subprocess.run(
+                ['fping', '-a', '-q', '-A', '-r', '1', '-t', '250'] + ips,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=30
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return None
+        
+        # 0 = כולם ענו, 1 = חלק לא ענו, 2+ = שגיאה
+        if result.returncode > 1:
+            logger.debug(f"fping failed (exit code {result.returncode}), falling back to ping")
+            return None
+        
+        return result.stdout.split()
+    
+    async def _ping_all(self, ips: List[str]) -> List[bool]:
+        """
+        PING לכל ה-IPs במקביל, עד PING_CONCURRENCY תהליכים פתוחים בו-זמנית
+        
+        Args:
+            ips: ה-IPs לבדיקה
             
-            # PING עם timeout קצר
-            if is_windows:
-                # Windows: ping -n 1 -w 1000
-                result = subprocess.run(
-                    ['ping', '-n', '1', '-w', '1000', ip],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
+        Returns:
+            לכל IP (לפי הסדר) - True אם המכשיר ענה
+        """
+        semaphore = asyncio.Semaphore(self.PING_CONCURRENCY)
+        
+        async def ping_one(ip: str) -> bool:
+            async with semaphore:
+                process = await asyncio.create_subprocess_exec(
+                    *self._ping_base, ip,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
                 )
-            else:
-                # Linux/Mac: ping -c 1 -W 1
-                result = subprocess.run(
-                    ['ping', '-c', '1', '-W', '1', ip],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
+                return await process.wait() == 0
+        
+        return await asyncio.gather(*(ping_one(ip) for ip in ips))
+    
+    def arp_sweep(self, network: Optional[str] = None) -> Optional[List[Tuple[str, str]]]:
+        """
+        סריקת ARP לכל הרשת בבת אחת (דורש root)
+        
+        שולח ARP request לכל ה-IPs במקביל וממתין לתשובות פעם אחת,
+        במקום ping נפרד לכל IP. ARP עובר גם דרך firewalls שחוסמים ICMP.
+        משתמש ב-scapy, ואם הוא לא מותקן - ב-arp-scan.
+        
+        Args:
+            network: הרשת לסריקה (ברירת מחדל: self.network)
+        
+        Returns:
+            רשימת (ip, mac) של מכשירים שענו, או None אם אין הרשאות / כלי ARP
+        """
+        network = network or self.network
+        logger.info(f"Starting ARP sweep on {network}")
+        
+        scapy = _load_scapy()
+        if scapy is not None:
+            ARP, Ether, srp, Scapy_Exception = scapy
+            try:
+                # iface_hint - לשלוח מה-interface שמנתב לרשת הזו, לא מה-default route
+                answered, _ = srp(
+                    Ether(dst="ff:ff:ff:ff:ff:ff") / ARP(pdst=network),
+                    iface_hint=network,
+                    timeout=2,
+                    verbose=0
                 )
+            except (OSError, RuntimeError, Scapy_Exception) as e:
+                # Linux בלי root: PermissionError. Mac/BSD: Scapy_Exception על /dev/bpf.
+                # Windows בלי Npcap: OSError / RuntimeError
+                logger.warning(f"ARP sweep not available ({e}), falling back to ping sweep")
+                return None
             
-            if result.returncode == 0:
-                active_ips.append(ip)
-                logger.debug(f"Found active device: {ip}")
+            hosts = [(received.psrc, received.hwsrc.upper()) for _, received in answered]
+        else:
+            hosts = self._arp_scan(network)
+            if hosts is None:
+                return None
         
-        logger.info(f"Ping sweep complete: {len(active_ips)} active devices")
-        return active_ips
+        logger.info(f"ARP sweep complete: {len(hosts)} active devices")
+        return hosts
+    
+    def _arp_scan(self, network: str) -> Optional[List[Tuple[str, str]]]:
+        """
+        סריקת ARP עם arp-scan (כשאין scapy)
+        
+        Args:
+            network: הרשת לסריקה
+        
+        Returns:
+            רשימת (ip, mac), או None אם arp-scan לא זמין או נכשל
+        """
+        try:
+            result = subprocess.run(
+                ['arp-scan', '--quiet', network],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=30
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return None
+        
+        if result.returncode != 0:
+            logger.debug(f"arp-scan failed (exit code {result.returncode}), falling back to ping")
+            return None
+        
+        # שורות תוצאה: "192.168.1.1<TAB>aa:bb:cc:dd:ee:ff" - שאר השורות הן כותרות
+        hosts = []
+        seen = set()
+        for line in result.stdout.splitlines():
+            parts = line.split('\t')
+            if len(parts) >= 2 and parts[1].count(':') == 5 and parts[0] not in seen:
+                seen.add(parts[0])
+                hosts.append((parts[0], parts[1].upper()))
+        
+        return hosts
     
     def get_mac_address(self, ip: str) -> Optional[str]:
         """
         מחזיר MAC address של IP
         
-        משתמש ב-ARP table של המערכת
+        משתמש ב-ARP table של המערכת - נטען פעם אחת לכל סריקה
         
         Args:
             ip: כתובת IP
@@ -150,30 +465,61 @@ class NetworkScanner:
         Returns:
             MAC address או None
         """
+        if self._arp_cache is None:
+            self._arp_cache = self._load_arp_table()
+        
+        mac = self._arp_cache.get(ip)
+        if mac:
+            logger.debug(f"{ip} -> MAC: {mac}")
+        return mac
+    
+    def _load_arp_table(self) -> Dict[str, str]:
+        """
+        טוען את כל ה-ARP table של המערכת
+        
+        ב-Linux קורא ישירות מ-/proc/net/arp (בלי subprocess).
+        ב-Windows/Mac מריץ arp -a פעם אחת ומפרסר את כל הטבלה.
+        
+        Returns:
+            Dictionary של {ip: mac}
+        """
+        table = {}
+        
+        try:
+            with open('/proc/net/arp') as f:
+                next(f)  # שורת כותרת
+                for line in f:
+                    parts = line.split()
+                    # 00:00:00:00:00:00 = רשומה לא שלמה (המכשיר לא ענה)
+                    if len(parts) >= 4 and parts[3] != '00:00:00:00:00:00':
+                        table[parts[0]] = parts[3].upper()
+            return table
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Failed to read ARP table: {e}")
+            return table
+        
+        if self._is_windows:
+            arp_args = ['arp', '-a']
+        else:
+            arp_args = ['arp', '-an']
+        
         try:
-            # קרא את ה-ARP table
             result = subprocess.run(
-                ['arp', '-n', ip],
+                arp_args,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stderr=subprocess.DEVNULL
             )
             
-            # חפש MAC בפורמט XX:XX:XX:XX:XX:XX
-            match = re.search(
-                r'([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})',
-                result.stdout
-            )
-            
-            if match:
-                mac = match.group(0).upper()
-                logger.debug(f"{ip} -> MAC: {mac}")
-                return mac
+            for match in _ARP_ENTRY_RE.finditer(result.stdout):
+                octets = match.group(2).decode().replace('-', ':').split(':')
+                table[match.group(1).decode()] = ':'.join(octet.zfill(2) for octet in octets).upper()
             
         except Exception as e:
-            logger.error(f"Failed to get MAC for {ip}: {e}")
+            logger.error(f"Failed to read ARP table: {e}")
         
-        return None
+        return table
     
     def get_vendor(self, mac: str) -> str:
         """
@@ -185,19 +531,17 @@ class NetworkScanner:
         Returns:
             שם היצרן או "Unknown"
         """
-        # קח 3 בתים ראשונים (OUI)
-        oui = ':'.join(mac.split(':')[:3]).upper()
-        
-        vendor = self.vendor_db.get(oui, 'Unknown')
+        # 3 בתים ראשונים (OUI) כמספר - OUI הוא בדיוק 24 ביט, אין התאמה חלקית
+        try:
+            oui = int(mac[:8].replace(':', '').replace('-', ''), 16)
+        except ValueError:
+            return 'Unknown'
         
-        # אם לא מצאנו, נסה עם הבתים הראשונים
-        if vendor == 'Unknown':
-            # חיפוש חלקי
-            for known_oui, known_vendor in self.vendor_db.items():
-                if oui.startswith(known_oui[:5]):  # 2 בתים ראשונים
-                    return known_vendor
+        vendor = self._oui_map.get(oui)
+        if vendor is None and self._oui_db is not None:
+            vendor = self._oui_db.lookup(oui)
         
-        return vendor
+        return vendor or 'Unknown'
     
     def get_hostname(self, ip: str) -> Optional[str]:
         """
@@ -209,12 +553,12 @@ class NetworkScanner:
         Returns:
             Hostname או None
         """
-        try:
-            hostname = socket.gethostbyaddr(ip)[0]
-            logger.debug(f"{ip} -> Hostname: {hostname}")
-            return hostname
-        except socket.herror:
+        hostname = _resolve(ip, int(time.monotonic() // HOSTNAME_CACHE_TTL))
+        if not hostname:
             return None
+        
+        logger.debug(f"{ip} -> Hostname: {hostname}")
+        return hostname
     
     def identify_device_type(self, vendor: str, hostname: Optional[str]) -> str:
         """
@@ -227,45 +571,72 @@ class NetworkScanner:
         Returns:
             סוג המכשיר
         """
-        hostname_lower = hostname.lower() if hostname else ""
-        vendor_lower = vendor.lower()
-        
         # זיהוי לפי hostname
-        if 'iphone' in hostname_lower or 'ipad' in hostname_lower:
-            return 'Mobile Device (iOS)'
-        elif 'android' in hostname_lower:
-            return 'Mobile Device (Android)'
-        elif 'laptop' in hostname_lower or 'pc' in hostname_lower:
-            return 'Computer'
-        elif 'tv' in hostname_lower:
-            return 'Smart TV'
-        elif 'router' in hostname_lower:
-            return 'Router'
+        if hostname:
+            hostname_lower = hostname.lower()
+            for keyword, device_type in _HOSTNAME_RULES:
+                if keyword in hostname_lower:
+                    return device_type
         
         # זיהוי לפי vendor
-        if 'apple' in vendor_lower:
-            return 'Apple Device'
-        elif 'raspberry' in vendor_lower:
-            return 'Raspberry Pi'
-        elif 'samsung' in vendor_lower:
-            return 'Samsung Device'
-        elif 'google' in vendor_lower:
-            return 'Google Device'
+        vendor_lower = vendor.lower()
+        for keyword, device_type in _VENDOR_RULES:
+            if keyword in vendor_lower:
+                return device_type
         
         return 'Unknown Device'
     
-    def scan_device(self, ip: str) -> Dict:
+    def _discover(self, network: str) -> List[Tuple[str, Optional[str]]]:
+        """
+        מוצא IPs פעילים ברשת אחת
+        
+        ARP sweep מחזיר גם את ה-MAC; אם הוא לא אפשרי, או שאף אחד לא ענה
+        (למשל רשת שלא מחוברת ישירות) - PING sweep.
+        
+        Args:
+            network: הרשת לסריקה
+        
+        Returns:
+            רשימת (ip, mac) - mac הוא None אם לא ידוע
+        """
+        hosts = self.arp_sweep(network)
+        if not hosts:
+            hosts = [(ip, None) for ip in self.ping_sweep(network)]
+        return hosts
+    
+    def _merge(self, record: DeviceRecord):
+        """
+        מוסיף רשומה מאחד משלבי הגילוי - IP שכבר נמצא מתמזג, לא נסרק שוב
+        
+        Args:
+            record: מה ששלב הגילוי מצא על ה-IP
+        """
+        existing = self._records.get(record.ip)
+        if existing is None:
+            self._records[record.ip] = record
+        else:
+            existing.merge(record)
+    
+    def scan_device(self, record: DeviceRecord) -> Dict:
         """
         סריקה מלאה של מכשיר בודד
         
+        משלים רק את מה ששלבי הגילוי לא מצאו (MAC, hostname).
+        
         Args:
-            ip: כתובת IP לסריקה
+            record: מה שכבר ידוע על המכשיר (למשל MAC מ-ARP sweep)
             
         Returns:
             Dictionary עם כל המידע על המכשיר
         """
-        mac = self.get_mac_address(ip)
-        hostname = self.get_hostname(ip)
+        ip = record.ip
+        if record.mac is None:
+            record.mac = self.get_mac_address(ip)
+        if record.hostname is None:
+            record.hostname = self.get_hostname(ip)
+        
+        mac = record.mac
+        hostname = record.hostname
         vendor = self.get_vendor(mac) if mac else "Unknown"
         device_type = self.identify_device_type(vendor, hostname)
         
@@ -303,14 +674,32 @@ class NetworkScanner:
         logger.info("Starting Full Network Scan")
         logger.info("="*70)
         
-        # שלב 1: מצא IPs פעילים
-        active_ips = self.ping_sweep()
+        # ה-ARP table משתנה בין סריקות - טען מחדש
+        self._arp_cache = None
+        self._records = {}
+        
+        # שלב 1: מצא IPs פעילים בכל הרשתות - במקביל, כך שכמה interfaces
+        # לוקחים בערך כמו interface אחד
+        if len(self.networks) == 1:
+            results = [self._discover(self.network)]
+        else:
+            with ThreadPoolExecutor(max_workers=len(self.networks)) as executor:
+                results = list(executor.map(self._discover, self.networks))
         
-        # שלב 2: סרוק כל IP
-        devices = []
-        for ip in active_ips:
-            device = self.scan_device(ip)
-            devices.append(device)
+        # IP שהופיע כמה פעמים (למשל כמה תשובות ARP) נסרק פעם אחת
+        for hosts in results:
+            for ip, mac in hosts:
+                self._merge(DeviceRecord(ip=ip, mac=mac))
+        
+        records = list(self._records.values())
+        
+        # טען את ה-ARP table לפני ה-threads, כדי שלא כל thread יטען אותו בעצמו
+        if any(record.mac is None for record in records):
+            self._arp_cache = self._load_arp_table()
+        
+        # שלב 2: סרוק כל IP - במקביל, כי gethostbyaddr יכול לחכות כמה שניות
+        with ThreadPoolExecutor(max_workers=min(32, len(records) or 1)) as executor:
+            devices = list(executor.map(self.scan_device, records))
         
         self.devices = devices
         
@@ -327,16 +716,32 @@ class NetworkScanner:
         Args:
             device: פרטי המכשיר
         """
-        if device['mac']:
-            self.known_devices[device['mac']] = {
-                'ip': device['ip'],
-                'hostname': device['hostname'],
-                'vendor': device['vendor'],
-                'type': device['type'],
-                'first_seen': device['first_seen'],
-                'friendly_name': None  # למשתמש להוסיף
-            }
+        self.add_many_to_known_devices([device])
+    
+    def add_many_to_known_devices(self, devices: List[Dict]):
+        """
+        מוסיף כמה מכשירים לרשימת המוכרים - ושומר את הקובץ פעם אחת
+        
+        Args:
+            devices: פרטי המכשירים
+        """
+        added = [device for device in devices if device['mac']]
+        if not added:
+            return
+        
+        with self._known_devices_lock:
+            for device in added:
+                self.known_devices[device['mac']] = {
+                    'ip': device['ip'],
+                    'hostname': device['hostname'],
+                    'vendor': device['vendor'],
+                    'type': device['type'],
+                    'first_seen': device['first_seen'],
+                    'friendly_name': None  # למשתמש להוסיף
+                }
             self.save_known_devices()
+        
+        for device in added:
             logger.info(f"Added {device['mac']} to known devices")
     
     def print_devices(self):
@@ -353,13 +758,21 @@ class NetworkScanner:
         print(f"{'IP':<15} {'MAC':<18} {'Vendor':<20} {'Type':<20} {'Status':<10}")
         print("-"*90)
         
+        # הסיכום נספר באותו מעבר של ההדפסה
+        new_count = 0
+        known_count = 0
+        
         for device in self.devices:
             ip = device['ip']
             mac = device['mac'] or 'N/A'
             vendor = device['vendor']
             device_type = device['type']
             
+            if device['is_known']:
+                known_count += 1
+            
             if device['is_new']:
+                new_count += 1
                 status = "🆕 NEW"
             elif device['is_known']:
                 status = "✅ Known"
@@ -371,9 +784,6 @@ class NetworkScanner:
         print("="*90)
         
         # סיכום
-        new_count = sum(1 for d in self.devices if d['is_new'])
-        known_count = sum(1 for d in self.devices if d['is_known'])
-        
         print(f"\nSummary:")
         print(f"  Total Devices: {len(self.devices)}")
         print(f"  Known Devices: {known_count}")
@@ -386,8 +796,6 @@ if __name__ == "__main__":
     """
     סריקת רשת ביתית
     """
-    import sys
-    
     # הגדר logging
     logging.basicConfig(
         level=logging.INFO,
@@ -421,8 +829,7 @@ if __name__ == "__main__":
             print(f"\n🆕 Found {len(new_devices)} new device(s)!")
             answer = input("Add them to known devices? (y/n): ")
             if answer.lower() == 'y':
-                for device in new_devices:
-                    scanner.add_to_known_devices(device)
+                scanner.add_many_to_known_devices(new_devices)
                 print("✅ New devices added to known list!")
         
     except KeyboardInterrupt:
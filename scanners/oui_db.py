@@ -0,0 +1,197 @@
+"""
+OUI Database - מאגר יצרנים מלא של IEEE
+========================================
+
+ה-vendor_db המובנה ב-NetworkScanner מכיר רק כמה עשרות יצרנים.
+כאן טוענים את כל קובץ ה-OUI של IEEE (~30,000 יצרנים) מקובץ בינארי
+ארוז, דרך mmap - כלומר כמעט בלי זיכרון ובלי זמן טעינה.
+
+פורמט הקובץ (oui.bin, little-endian):
+- header: b'OUI1' + uint32 count
+- count x uint32: ה-OUIs, ממוינים
+- count x uint32: offset של שם היצרן בתוך ה-blob
+- blob: שמות יצרנים, כל אחד מסתיים ב-\\0
+
+חיפוש = bisect על מערך ה-OUIs (O(log N)).
+
+בניית הקובץ (פעם אחת):
+    curl -O https://standards-oui.ieee.org/oui/oui.txt
+    python3 scanners/oui_db.py oui.txt
+"""
+
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Optional, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+# מיקום ברירת מחדל - data/ בשורש הפרויקט
+OUI_DB_PATH = Path(__file__).resolve().parent.parent / 'data' / 'oui.bin'
+
+_MAGIC = b'OUI1'
+_HEADER = struct.Struct('<4sI')
+
+# שורה ב-oui.txt: "00-1A-11   (hex)\t\tGoogle, Inc."
+_OUI_LINE_RE = re.compile(r'^\s*([0-9A-Fa-f]{2})-([0-9A-Fa-f]{2})-([0-9A-Fa-f]{2})\s+\(hex\)\s+(.+?)\s*$')
+
+
+def parse_oui_txt(path: Union[str, Path]) -> Dict[int, str]:
+    """
+    מפרסר את oui.txt של IEEE
+    
+    Args:
+        path: נתיב ל-oui.txt
+    
+    Returns:
+        Dictionary של {oui (24 ביט): שם יצרן}
+    """
+    ouis = {}
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            match = _OUI_LINE_RE.match(line)
+            if match:
+                oui = int(match.group(1) + match.group(2) + match.group(3), 16)
+                ouis[oui] = match.group(4)
+    return ouis
+
+
+def build(ouis: Dict[int, str], out_path: Union[str, Path] = OUI_DB_PATH):
+    """
+    כותב את מאגר ה-OUI לקובץ בינארי ארוז
+    
+    Args:
+        ouis: Dictionary של {oui: שם יצרן}
+        out_path: לאן לכתוב
+    """
+    sorted_ouis = sorted(ouis)
+    
+    # שם שחוזר על עצמו (יצרנים עם הרבה OUIs) נשמר ב-blob פעם אחת
+    blob = bytearray()
+    name_offsets = {}
+    offsets = []
+    for oui in sorted_ouis:
+        name = ouis[oui]
+        if name not in name_offsets:
+            name_offsets[name] = len(blob)
+            blob += name.encode('utf-8') + b'\0'
+        offsets.append(name_offsets[name])
+    
+    count = len(sorted_ouis)
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # כותב לקובץ זמני ומחליף - בנייה שנקטעה לא משאירה oui.bin חתוך
+    tmp_path = out_path.with_name(out_path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, count))
+        f.write(struct.pack(f'<{count}I', *sorted_ouis))
+        f.write(struct.pack(f'<{count}I', *offsets))
+        f.write(blob)
+    os.replace(tmp_path, out_path)
+    
+    logger.info(f"Wrote {count} OUIs ({len(name_offsets)} vendors) to {out_path}")
+
+
+class OUIDatabase:
+    """
+    מאגר OUI לקריאה בלבד, על גבי mmap
+    
+    מערכת ההפעלה טוענת רק את העמודים שבאמת נקראים,
+    כך שפתיחת הקובץ כמעט לא עולה זיכרון.
+    """
+    
+    def __init__(self, path: Union[str, Path] = OUI_DB_PATH):
+        """
+        Args:
+            path: נתיב ל-oui.bin
+        
+        Raises:
+            FileNotFoundError: אם הקובץ לא קיים
+            ValueError: אם הקובץ לא בפורמט הנכון או חתוך
+        """
+        with open(path, 'rb') as f:
+            # קובץ ריק - mmap זורק ValueError בעצמו
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if len(self._mm) < _HEADER.size:
+            self._mm.close()
+            raise ValueError(f"{path} is truncated")
+        
+        magic, count = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not an OUI database")
+        
+        ouis_start = _HEADER.size
+        offsets_start = ouis_start + 4 * count
+        self._names_start = offsets_start + 4 * count
+        
+        # הקובץ חייב להכיל את שני המערכים, ו-blob שמסתיים ב-\0
+        if len(self._mm) < self._names_start or (count and self._mm[-1] != 0):
+            self._mm.close()
+            raise ValueError(f"{path} is truncated")
+        
+        if sys.byteorder == 'little':
+            # ישירות מעל ה-mmap, בלי העתקה
+            view = memoryview(self._mm)
+            self._ouis = view[ouis_start:offsets_start].cast('I')
+            self._offsets = view[offsets_start:self._names_start].cast('I')
+            view.release()
+        else:
+            self._ouis = array('I', self._mm[ouis_start:offsets_start])
+            self._offsets = array('I', self._mm[offsets_start:self._names_start])
+            self._ouis.byteswap()
+            self._offsets.byteswap()
+        
+        # כל offset חייב להצביע לתוך ה-blob (אחרת הקובץ נחתך באמצע השמות)
+        if count and max(self._offsets) >= len(self._mm) - self._names_start:
+            self.close()
+            raise ValueError(f"{path} is truncated")
+    
+    def __len__(self) -> int:
+        return len(self._ouis)
+    
+    def lookup(self, oui: int) -> Optional[str]:
+        """
+        מחפש יצרן לפי OUI
+        
+        Args:
+            oui: 3 הבתים הראשונים של ה-MAC כמספר של 24 ביט
+        
+        Returns:
+            שם היצרן או None
+        """
+        index = bisect_left(self._ouis, oui)
+        if index == len(self._ouis) or self._ouis[index] != oui:
+            return None
+        
+        start = self._names_start + self._offsets[index]
+        end = self._mm.find(b'\0', start)
+        return self._mm[start:end].decode('utf-8')
+    
+    def close(self):
+        """
+        משחרר את ה-mmap
+        """
+        if isinstance(self._ouis, memoryview):
+            self._ouis.release()
+            self._offsets.release()
+        self._mm.close()
+
+
+# ==== בניית הקובץ ====
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python3 oui_db.py <oui.txt> [output.bin]")
+        sys.exit(1)
+    
+    build(parse_oui_txt(sys.argv[1]), sys.argv[2] if len(sys.argv) == 3 else OUI_DB_PATH)